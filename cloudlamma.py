@@ -5,23 +5,23 @@ with model download and management functionality.
 """
 
 import argparse
+import functools
+import io
+import json
 import os
+import platform
 import re
+import selectors
 import shutil
+import signal
+import socket
 import subprocess
 import sys
-import tempfile
+import threading
 import time
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-# Try to import requests, provide helpful error if missing
-try:
-    import requests
-except ImportError:
-    print("\033[91m[!]\033[0m Missing dependency: requests")
-    print("Please install it with: pip install requests")
-    sys.exit(1)
 
 @dataclass
 class Config:
@@ -33,22 +33,30 @@ class Config:
     # Timeout settings (in seconds)
     install_timeout: int = 300
     update_timeout: int = 120
+    apt_update_max_age: int = 3600  # skip apt update if the package lists are newer
     download_timeout: int = 120
     service_timeout: int = 60
     api_timeout: int = 30
+    connect_timeout: int = 3  # seconds to establish a connection to remote hosts
     health_check_timeout: int = 5
     
     # Retry settings
     max_retries: int = 3
     retry_delay: float = 1.0
-    retry_backoff: float = 2.0
+    retry_jitter: float = 1.0      # up to this many random seconds added to each backoff
+    retry_max_delay: float = 30.0  # cap on a single backoff
     
     # Service startup settings
     ollama_startup_wait: int = 30  # seconds
     tunnel_url_wait: int = 30      # seconds
     
+    # Persistent tunnel state (see --persist)
+    tunnel_state_dir: str = "~/.cloudflared"
+    tunnel_log_max_bytes: int = 1 << 20  # tunnel log size that triggers truncation on the next run
+    
     # Model validation
     max_model_name_length: int = 100
+    models_cache_ttl: float = 5.0  # seconds to reuse the installed-models list
     
     # Colors for output
     green: str = "\033[92m"
@@ -59,12 +67,119 @@ class Config:
 # Global config instance
 config = Config()
 
+# Colored prefixes for print_message, by message level
+_PREFIXES = {
+    "info": f"{config.green}[+]{config.reset}",
+    "warn": f"{config.yellow}[!]{config.reset}",
+    "error": f"{config.red}[!]{config.reset}",
+    "question": f"{config.yellow}[?]{config.reset}",
+}
+
+# Allowed model names: alphanumerics, dots, dashes, underscores and colons for tags,
+# up to the configured length. \Z rather than $ so a trailing newline is rejected too.
+_MODEL_NAME_RE = re.compile(rf'^[a-zA-Z0-9._:-]{{1,{config.max_model_name_length}}}\Z')
+
+# Matches the public URL cloudflared prints for a quick (trycloudflare) tunnel: a single
+# hyphenated label, never the api. host that shows up in cloudflared's error messages
+_TRYCF_RE = re.compile(rb"https://(?!api\.)[A-Za-z0-9-]+\.trycloudflare\.com")
+
+
+def _import_requests():
+    """Import requests on first use, providing a helpful error if it is missing
+
+    Deferred so that commands which never make HTTP calls (e.g. --check) don't
+    pay for loading requests and urllib3 at startup.
+    """
+    try:
+        import requests
+    except ImportError:
+        print(f"{config.red}[!]{config.reset} Missing dependency: requests")
+        print("Please install it with: pip install requests")
+        sys.exit(1)
+    return requests
+
+
+# cloudflared .deb release asset for each machine architecture name
+_CLOUDFLARED_DEB_URLS = {
+    "x86_64": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64.deb",
+    "amd64": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64.deb",
+    "aarch64": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-arm64.deb",
+    "arm64": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-arm64.deb",
+    "armv7l": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-armhf.deb",
+    "armhf": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-armhf.deb",
+    "i386": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-386.deb",
+    "i686": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-386.deb",
+}
+
+# Address used to reach the local Ollama daemon. An IPv4 literal rather than
+# "localhost" so requests don't try ::1 first when Ollama listens on IPv4 only.
+_OLLAMA_ADDR = "127.0.0.1"
+
+
+def _ollama_api_url(path: str) -> str:
+    """Build a URL for the local Ollama HTTP API"""
+    return f"http://{_OLLAMA_ADDR}:{config.ollama_port}{path}"
+
+
+# Shared HTTP session, created on first use by _get_session()
+_session = None
+
+
+def _get_session():
+    """Return the shared HTTP session
+
+    The session keeps connections alive between calls. Remote (https) calls
+    retry transient failures with exponential backoff at the transport level;
+    plain http only reaches the local Ollama API, where a refused connection
+    means the daemon isn't running and callers need to know straight away.
+    """
+    global _session
+    if _session is None:
+        requests = _import_requests()
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=config.max_retries,
+                backoff_factor=config.retry_delay,
+                backoff_jitter=config.retry_jitter,  # Spread out clients that fail at the same moment
+                backoff_max=config.retry_max_delay,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False,  # Hand the final response back for normal status handling
+            ),
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))  # No retries
+        _session = session
+    return _session
+
+
+@functools.lru_cache(maxsize=32)
+def _which(command: str) -> Optional[str]:
+    """Cached shutil.which; PATH lookups are repeated for the same few commands"""
+    return shutil.which(command)
+
+
+@functools.lru_cache(maxsize=1)
+def _ollama_serve_env() -> Dict[str, str]:
+    """Environment for `ollama serve`, built once on first use and reused afterwards"""
+    env = os.environ.copy()
+    env["OLLAMA_HOST"] = "0.0.0.0"
+    return env
+
 
 class OllamaSetup:
     """Main class for Ollama setup and management"""
 
     def __init__(self):
-        self.parser = self._create_argument_parser()
+        self.args: Optional[argparse.Namespace] = None  # Parsed once in run()
+        self._models_cache: Optional[Tuple[float, List[str]]] = None  # (fetched_at, models)
+        self._ollama_running = False  # Set once something is seen listening on the port
+        self._ollama_ready = False  # Set once Ollama has been confirmed responsive
 
     def _create_argument_parser(self) -> argparse.ArgumentParser:
         """Create the command line argument parser"""
@@ -108,90 +223,106 @@ class OllamaSetup:
             action="store_true",
             help="Show detailed output from cloudflared tunnel",
         )
+        parser.add_argument(
+            "--persist",
+            action="store_true",
+            help="Run the tunnel in the background so later runs reuse it instead of starting a new one",
+        )
+        parser.add_argument(
+            "--stop-tunnel",
+            action="store_true",
+            help="Stop the background tunnel started with --persist",
+        )
         return parser
 
     def print_message(self, message: str, level: str = "info") -> None:
         """Print formatted messages"""
-        prefix = {
-            "info": f"{config.green}[+]{config.reset}",
-            "warn": f"{config.yellow}[!]{config.reset}",
-            "error": f"{config.red}[!]{config.reset}",
-            "question": f"{config.yellow}[?]{config.reset}",
-        }
-        print(f"{prefix.get(level, prefix['info'])} {message}")
+        sys.stdout.write(f"{_PREFIXES.get(level, _PREFIXES['info'])} {message}\n")
 
     def validate_model_name(self, model_name: str) -> bool:
         """Validate model name to prevent command injection and ensure reasonable format"""
-        if not model_name or not isinstance(model_name, str):
-            return False
-        
-        # Check for dangerous characters that could be used for command injection
-        dangerous_chars = [';', '&', '|', '`', '$', '(', ')', '<', '>', '"', "'", '\\', '\n', '\r']
-        if any(char in model_name for char in dangerous_chars):
-            return False
-        
-        # Model names should be reasonable (alphanumeric, dots, dashes, underscores, colons for tags)
-        if not re.match(r'^[a-zA-Z0-9._:-]+$', model_name):
+        if not isinstance(model_name, str):
             return False
         
-        # Reasonable length limits
-        if len(model_name) > config.max_model_name_length:
-            return False
-            
-        return True
+        # One pass checks both the allowed characters and the length limit. The
+        # allow-list also rules out every shell metacharacter, so no separate
+        # dangerous-character scan is needed to prevent command injection
+        return _MODEL_NAME_RE.match(model_name) is not None
 
     def sanitize_model_name(self, model_name: str) -> str:
         """Sanitize and validate model name, raising ValueError if invalid"""
         if not self.validate_model_name(model_name):
             raise ValueError(f"Invalid model name: '{model_name}'. Model names must contain only letters, numbers, dots, dashes, underscores, and colons.")
-        return model_name.strip()
+        # A valid name can't contain whitespace, so there is nothing left to strip
+        return model_name
 
-    def retry_operation(self, operation, max_retries: int = None, delay: float = None, backoff: float = None):
-        """Retry an operation with exponential backoff"""
-        max_retries = max_retries or config.max_retries
-        delay = delay or config.retry_delay
-        backoff = backoff or config.retry_backoff
-        
-        for attempt in range(max_retries):
-            try:
-                return operation()
-            except (requests.exceptions.RequestException, subprocess.CalledProcessError) as e:
-                if attempt == max_retries - 1:
-                    raise e
-                
-                wait_time = delay * (backoff ** attempt)
-                self.print_message(
-                    f"Operation failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time:.1f}s...",
-                    "warn"
-                )
-                time.sleep(wait_time)
-        
-        raise Exception("All retry attempts failed")
+    def _run(
+        self,
+        cmd: List[str],
+        *,
+        timeout: Optional[float] = None,
+        capture: bool = False,
+        check: bool = True,
+        input: Optional[bytes] = None,
+        stderr: Optional[int] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a command to completion with consistent subprocess settings
+
+        With capture=True, stdout and stderr are collected as text; input, if
+        given, is written to the command's stdin as bytes. stderr overrides
+        where the command's stderr goes, e.g. subprocess.DEVNULL. Failures
+        raise the usual subprocess.CalledProcessError / TimeoutExpired for the
+        caller to report.
+        """
+        if stderr is None and capture:
+            stderr = subprocess.PIPE
+        return subprocess.run(
+            cmd,
+            timeout=timeout,
+            check=check,
+            stdout=subprocess.PIPE if capture else None,
+            stderr=stderr,
+            input=input,
+            text=capture,
+            close_fds=True
+        )
 
     def is_installed(self, command: str) -> bool:
         """Check if a command is installed"""
-        return shutil.which(command) is not None
+        return _which(command) is not None
+
+    def _apt_update(self) -> None:
+        """Run apt update unless the package lists were refreshed recently"""
+        for stamp in ("/var/lib/apt/periodic/update-success-stamp", "/var/lib/apt/lists"):
+            try:
+                if time.time() - os.path.getmtime(stamp) < config.apt_update_max_age:
+                    return
+            except OSError:
+                pass
+        self._run(["sudo", "apt", "update"], timeout=config.update_timeout)
 
     def install_ollama(self) -> None:
         """Install Ollama using the appropriate package manager"""
         self.print_message("Installing Ollama...")
+        requests = _import_requests()
         try:
             if self.is_installed("brew"):
-                subprocess.run(["brew", "install", "ollama"], check=True, timeout=config.install_timeout)
+                self._run(["brew", "install", "ollama"], timeout=config.install_timeout)
             elif self.is_installed("apt"):
-                subprocess.run(["sudo", "apt", "update"], check=True, timeout=config.update_timeout)
+                self._apt_update()
                 self.print_message(
                     "Ollama is not available in the default apt repositories. "
                     "Installing via install script...",
                     "warn"
                 )
-                install_script = subprocess.run(
-                    ["curl", "-fsSL", "https://ollama.com/install.sh"],
-                    capture_output=True,
-                    check=True,
-                    timeout=config.download_timeout
-                ).stdout.decode()
-                subprocess.run(["sh"], input=install_script, text=True, check=True, timeout=config.install_timeout)
+                # Download the whole script before running any of it, so a dropped
+                # connection can never leave sh executing a truncated command
+                response = _get_session().get(
+                    "https://ollama.com/install.sh",
+                    timeout=(config.connect_timeout, config.download_timeout)
+                )
+                response.raise_for_status()
+                self._run(["sh"], input=response.content, timeout=config.install_timeout)
             else:
                 self.print_message(
                     "Unsupported package manager. Please install Ollama manually from https://ollama.com/",
@@ -211,21 +342,33 @@ class OllamaSetup:
                 "error"
             )
             sys.exit(1)
+        except requests.exceptions.RequestException as e:
+            self.print_message(
+                f"Failed to download the Ollama install script: {e}. Please check your internet connection.",
+                "error"
+            )
+            sys.exit(1)
         except Exception as e:
             self.print_message(f"Unexpected error during installation: {e}", "error")
             sys.exit(1)
 
+        # The new binary is now on PATH
+        _which.cache_clear()
+
     def install_cloudflared(self) -> None:
         """Install cloudflared using the appropriate package manager"""
         self.print_message("Installing cloudflared...")
+        requests = _import_requests()
+        import tempfile
+        deb_path = None
         try:
             if self.is_installed("brew"):
-                subprocess.run(["brew", "install", "cloudflared"], check=True, timeout=config.install_timeout)
+                self._run(["brew", "install", "cloudflared"], timeout=config.install_timeout)
             elif self.is_installed("apt"):
-                subprocess.run(["sudo", "apt", "update"], check=True, timeout=config.update_timeout)
+                self._apt_update()
                 
                 # Determine architecture for correct package
-                arch = subprocess.check_output(["uname", "-m"], timeout=config.health_check_timeout).decode().strip()
+                arch = platform.machine() or "unknown"
                 url = self._get_cloudflared_url(arch)
                 if not url:
                     self.print_message(
@@ -235,8 +378,17 @@ class OllamaSetup:
                     )
                     sys.exit(1)
 
-                subprocess.run(["curl", "-L", "--output", "cloudflared.deb", url], check=True, timeout=config.download_timeout)
-                subprocess.run(["sudo", "dpkg", "-i", "cloudflared.deb"], check=True, timeout=config.service_timeout)
+                # Stream the package to a temp file over the shared session
+                with _get_session().get(
+                    url, stream=True, timeout=(config.connect_timeout, config.download_timeout)
+                ) as response:
+                    response.raise_for_status()
+                    with tempfile.NamedTemporaryFile(suffix=".deb", delete=False) as deb_file:
+                        deb_path = deb_file.name
+                        for chunk in response.iter_content(chunk_size=1 << 20):
+                            deb_file.write(chunk)
+
+                self._run(["sudo", "dpkg", "-i", deb_path], timeout=config.service_timeout)
                 self._setup_cloudflared_config()
             else:
                 self.print_message(
@@ -258,29 +410,29 @@ class OllamaSetup:
                 "error"
             )
             sys.exit(1)
+        except requests.exceptions.RequestException as e:
+            self.print_message(
+                f"Failed to download cloudflared: {e}. Please check your internet connection.",
+                "error"
+            )
+            sys.exit(1)
         except Exception as e:
             self.print_message(f"Unexpected error during installation: {e}", "error")
             sys.exit(1)
         finally:
             # Clean up downloaded file
-            try:
-                os.remove("cloudflared.deb")
-            except OSError:
-                pass
+            if deb_path:
+                try:
+                    os.remove(deb_path)
+                except OSError:
+                    pass
+
+        # The new binary is now on PATH
+        _which.cache_clear()
 
     def _get_cloudflared_url(self, arch: str) -> Optional[str]:
         """Get the appropriate cloudflared download URL based on architecture"""
-        urls = {
-            "x86_64": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64.deb",
-            "amd64": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64.deb",
-            "aarch64": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-arm64.deb",
-            "arm64": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-arm64.deb",
-            "armv7l": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-armhf.deb",
-            "armhf": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-armhf.deb",
-            "i386": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-386.deb",
-            "i686": "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-386.deb",
-        }
-        return urls.get(arch)
+        return _CLOUDFLARED_DEB_URLS.get(arch.lower())
 
     def _setup_cloudflared_config(self) -> None:
         """Create the default configuration for cloudflared"""
@@ -295,16 +447,36 @@ class OllamaSetup:
             f.write("ingress:\n")
             f.write(f"  - service: http://localhost:{config.ollama_port}\n")
         
-        subprocess.run(["sudo", "cloudflared", "service", "install"], check=True)
+        self._run(["sudo", "cloudflared", "service", "install"])
+
+    def _port_open(self, host: str, port: int, timeout: float) -> bool:
+        """Return whether a listener accepts a TCP connection on host:port"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(timeout)
+            return s.connect_ex((host, port)) == 0
+
+    def _wait_port_open(self, host: str, port: int, deadline: float) -> bool:
+        """Probe host:port until a listener accepts the connection or the deadline passes"""
+        while not self._port_open(host, port, timeout=0.1):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
 
     def is_ollama_running(self) -> bool:
-        """Check if Ollama is currently running on the configured port"""
-        result = subprocess.run(
-            ["lsof", "-i", f":{config.ollama_port}"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL
-        )
-        return result.returncode == 0
+        """Check if Ollama is currently running on the configured port
+
+        Anything accepting TCP connections on the port is treated as running.
+        A positive answer is remembered for the rest of the invocation.
+        """
+        if not self._ollama_running:
+            self._ollama_running = self._port_open(_OLLAMA_ADDR, config.ollama_port, timeout=0.2)
+        return self._ollama_running
+
+    def _check_ollama_api(self) -> bool:
+        """Issue a single request against the Ollama API and report whether it succeeded"""
+        response = _get_session().get(_ollama_api_url("/api/tags"), timeout=config.health_check_timeout)
+        return response.status_code == 200
 
     def is_ollama_responsive(self) -> bool:
         """Check if Ollama is running and responsive"""
@@ -312,37 +484,124 @@ class OllamaSetup:
             return False
         
         try:
-            def check_health():
-                response = requests.get(f"http://localhost:{config.ollama_port}/api/tags", timeout=config.health_check_timeout)
-                return response.status_code == 200
-            
-            return self.retry_operation(check_health, max_retries=2, delay=0.5)
+            return self._check_ollama_api()
         except Exception:
             return False
 
-    def start_ollama(self) -> None:
-        """Start the Ollama server and wait for it to be responsive"""
+    def _wait_ready(self, deadline: float) -> bool:
+        """Wait for the Ollama port to accept connections and its API to answer"""
+        if not self._wait_port_open(_OLLAMA_ADDR, config.ollama_port, deadline):
+            return False
+        self._ollama_running = True
+
+        # The listener can come up slightly before the API is serving
+        requests = _import_requests()
+        while True:
+            try:
+                if self._check_ollama_api():
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+
+    def start_ollama(self) -> bool:
+        """Start the Ollama server and wait for it to be responsive
+
+        Returns True only when this call started the server and saw its API answer.
+        """
         if not self.is_ollama_running():
             self.print_message("Starting Ollama on 0.0.0.0...")
             subprocess.Popen(
                 ["ollama", "serve"],
-                env={**os.environ, "OLLAMA_HOST": "0.0.0.0"},
+                env=_ollama_serve_env(),
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
             
-            # Wait for Ollama to be responsive
-            for attempt in range(config.ollama_startup_wait):  # configurable timeout
-                if self.is_ollama_responsive():
-                    self.print_message("Ollama is now ready.")
-                    return
-                time.sleep(1)
+            if self._wait_ready(time.monotonic() + config.ollama_startup_wait):
+                self.print_message("Ollama is now ready.")
+                return True
             
             self.print_message("Ollama started but may not be fully responsive yet.", "warn")
+        return False
+
+    def _ensure_ollama_ready(self) -> bool:
+        """Start Ollama if needed and report whether its API is responding"""
+        # Once confirmed, skip re-probing for the rest of this invocation
+        if self._ollama_ready:
+            return True
+
+        # start_ollama waits for the API itself; only probe again if it didn't confirm it
+        self._ollama_ready = self.start_ollama() or self.is_ollama_responsive()
+        return self._ollama_ready
+
+    def _wait_for_tunnel_url(self, process: subprocess.Popen, verbose: bool = False) -> Optional[str]:
+        """Read cloudflared output as it arrives and return the tunnel URL once printed"""
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        buffer = bytearray()
+        closed = False
+        deadline = time.monotonic() + config.tunnel_url_wait
+
+        with selectors.DefaultSelector() as sel:
+            sel.register(process.stdout, selectors.EVENT_READ)
+            while time.monotonic() < deadline and process.poll() is None:
+                if not sel.select(timeout=deadline - time.monotonic()):
+                    continue  # Timed out waiting for output
+
+                try:
+                    chunk = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    closed = True  # cloudflared closed its output
+                    break
+
+                buffer += chunk
+                *lines, rest = buffer.split(b"\n")
+                buffer = rest
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    # Only print detailed output if verbose mode is enabled
+                    if verbose:
+                        print(line.decode(errors="replace"))
+                    # Extract URL regardless of verbose mode
+                    match = _TRYCF_RE.search(line)
+                    if match:
+                        return match.group(0).decode()
+
+        if closed or process.poll() is not None:
+            self.print_message("Cloudflared process terminated unexpectedly", "error")
+        return None
 
-    def start_temp_tunnel(self) -> None:
+    def _drain_tunnel_output(self, process: subprocess.Popen, verbose: bool = False) -> None:
+        """Keep reading cloudflared output in the background so it never stalls on a full pipe"""
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, True)
+
+        def drain() -> None:
+            while True:
+                try:
+                    chunk = os.read(fd, 4096)
+                except OSError:
+                    return
+                if not chunk:
+                    return
+                if verbose:
+                    sys.stdout.flush()
+                    sys.stdout.buffer.write(chunk)
+                    sys.stdout.buffer.flush()
+
+        threading.Thread(target=drain, daemon=True).start()
+
+    def start_temp_tunnel(self, verbose: bool = False) -> None:
         """Start a temporary Cloudflare tunnel to expose Ollama"""
         self.print_message("Starting temporary Cloudflare tunnel...")
+        import tempfile
         
         # Create secure temporary config file
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.yml') as temp_config:
@@ -352,36 +611,21 @@ class OllamaSetup:
             process = subprocess.Popen(
                 ["cloudflared", "tunnel", "--config", temp_config_path, "--url", f"http://localhost:{config.ollama_port}"],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True
+                stderr=subprocess.STDOUT
             )
 
             # Wait for the tunnel URL to be printed
-            tunnel_url = None
-            for _ in range(config.tunnel_url_wait):  # configurable timeout
-                if process.poll() is not None:
-                    self.print_message("Cloudflared process terminated unexpectedly", "error")
-                    break
-                    
-                line = process.stdout.readline().strip()
-                if line:
-                    # Only print detailed output if verbose mode is enabled
-                    if self.parser.parse_args().verbose:
-                        print(line)
-                    # Extract URL regardless of verbose mode
-                    match = re.search(r"https://.*?\.trycloudflare\.com", line)
-                    if match:
-                        tunnel_url = match.group(0)
-                        break
-                time.sleep(1)
-                
+            tunnel_url = self._wait_for_tunnel_url(process, verbose)
+
             if tunnel_url:
                 print()  # Add space above URL
                 self.print_message(f"Temporary tunnel URL: {config.yellow}{tunnel_url}{config.reset}")
                 print("\nTunnel is now active. Press Ctrl+C to stop.\n")
+                self._drain_tunnel_output(process, verbose)
                 try:
-                    while True:
-                        time.sleep(1)
+                    # Block until cloudflared exits instead of waking every second
+                    process.wait()
+                    self.print_message("Cloudflared process exited; tunnel is no longer active.", "warn")
                 except KeyboardInterrupt:
                     self.print_message("Stopping tunnel...")
                     process.terminate()
@@ -395,6 +639,145 @@ class OllamaSetup:
             except OSError:
                 pass  # Ignore if file doesn't exist
 
+    def _tunnel_state_path(self, name: str) -> str:
+        """Return the path of a persistent-tunnel state file"""
+        return os.path.join(os.path.expanduser(config.tunnel_state_dir), f"cloudlamma-tunnel.{name}")
+
+    def _is_persistent_tunnel(self, pid: int) -> bool:
+        """Check that a PID belongs to the cloudflared started with --persist"""
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+        except OSError:
+            if os.path.isdir("/proc/self"):
+                return False  # procfs is available, so the process is gone
+            try:
+                cmdline = self._run(
+                    ["ps", "-p", str(pid), "-o", "command="],
+                    capture=True, check=False, stderr=subprocess.DEVNULL
+                ).stdout
+            except OSError:
+                return False
+        return "cloudflared" in cmdline and self._tunnel_state_path("yml") in cmdline
+
+    def _persistent_tunnel_pid(self) -> Optional[int]:
+        """Return the PID of the running persistent tunnel, removing stale state files"""
+        try:
+            with open(self._tunnel_state_path("pid")) as f:
+                pid = int(f.read().strip())
+            os.kill(pid, 0)  # Raises if the process is gone
+            if self._is_persistent_tunnel(pid):
+                return pid
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            pass
+
+        # The PID is dead or has been reused by another process
+        for name in ("pid", "url"):
+            try:
+                os.remove(self._tunnel_state_path(name))
+            except OSError:
+                pass
+        return None
+
+    def _persistent_tunnel_url(self) -> Optional[str]:
+        """Return the persistent tunnel's URL, once cloudflared has printed it"""
+        try:
+            with open(self._tunnel_state_path("url")) as f:
+                url = f.read().strip()
+        except OSError:
+            url = ""
+
+        log_path = self._tunnel_state_path("log")
+        try:
+            if not url:
+                with open(log_path, "rb") as log:
+                    match = _TRYCF_RE.search(log.read(1 << 16))  # The URL is printed at startup
+                if match is None:
+                    return None
+                url = match.group(0).decode()
+                with open(self._tunnel_state_path("url"), "w") as f:
+                    f.write(f"{url}\n")
+
+            # cloudflared appends to the log for as long as it runs. Nothing watches it
+            # in the background, so an oversized log is cut back whenever we're invoked.
+            if os.path.getsize(log_path) > config.tunnel_log_max_bytes:
+                os.truncate(log_path, 0)
+        except OSError:
+            pass
+        return url or None
+
+    def start_persistent_tunnel(self) -> None:
+        """Start a background tunnel that outlives this process, or reuse the running one"""
+        process = None
+        pid = self._persistent_tunnel_pid()
+        if pid is None:
+            self.print_message("Starting persistent Cloudflare tunnel...")
+            os.makedirs(os.path.expanduser(config.tunnel_state_dir), exist_ok=True)
+
+            # An empty config keeps cloudflared from picking up a named tunnel in config.yml
+            config_path = self._tunnel_state_path("yml")
+            open(config_path, "w").close()
+
+            try:
+                os.remove(self._tunnel_state_path("url"))
+            except OSError:
+                pass
+
+            # Append mode lets the log be truncated while cloudflared is writing to it
+            open(self._tunnel_state_path("log"), "wb").close()
+            with open(self._tunnel_state_path("log"), "ab") as log:
+                process = subprocess.Popen(
+                    ["cloudflared", "tunnel", "--config", config_path, "--url", f"http://localhost:{config.ollama_port}"],
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True  # Detach from this process and its terminal
+                )
+            with open(self._tunnel_state_path("pid"), "w") as f:
+                f.write(f"{process.pid}\n")
+        else:
+            self.print_message(f"Reusing persistent Cloudflare tunnel (PID {pid}).")
+
+        # Wait for the URL to show up in the log
+        deadline = time.monotonic() + config.tunnel_url_wait
+        tunnel_url = self._persistent_tunnel_url()
+        while tunnel_url is None and time.monotonic() < deadline:
+            if process is not None and process.poll() is not None:
+                break
+            time.sleep(0.1)
+            tunnel_url = self._persistent_tunnel_url()
+
+        if tunnel_url:
+            print()  # Add space above URL
+            self.print_message(f"Tunnel URL: {config.yellow}{tunnel_url}{config.reset}")
+            print("\nTunnel is running in the background. Stop it with --stop-tunnel.\n")
+        else:
+            self.print_message(
+                f"Failed to obtain tunnel URL. See {self._tunnel_state_path('log')} for details.",
+                "error"
+            )
+
+    def stop_persistent_tunnel(self) -> None:
+        """Stop the background tunnel started with --persist"""
+        pid = self._persistent_tunnel_pid()
+        if pid is None:
+            self.print_message("No persistent tunnel is running.", "warn")
+        else:
+            self.print_message(f"Stopping persistent tunnel (PID {pid})...")
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError as e:
+                self.print_message(f"Failed to stop tunnel: {e}", "error")
+                return
+
+        for name in ("pid", "url"):
+            try:
+                os.remove(self._tunnel_state_path(name))
+            except OSError:
+                pass
+
     def list_cloudflare_domains(self) -> None:
         """List domains registered in the Cloudflare account"""
         token = os.environ.get("CLOUDFLARE_API_TOKEN")
@@ -411,16 +794,14 @@ class OllamaSetup:
             "Content-Type": "application/json"
         }
         
+        requests = _import_requests()
+        url = "https://api.cloudflare.com/client/v4/zones"
         try:
-            def make_request():
-                return requests.get(
-                    "https://api.cloudflare.com/client/v4/zones", 
-                    headers=headers,
-                    timeout=config.api_timeout
-                )
-            
-            response = self.retry_operation(make_request)
-            
+            response = _get_session().get(
+                url, headers=headers, timeout=(config.connect_timeout, config.api_timeout)
+            )
+
+            # 401/403 are not transient and are reported straight away without retrying
             if response.status_code == 401:
                 self.print_message(
                     "Authentication failed. Please check your CLOUDFLARE_API_TOKEN.",
@@ -466,6 +847,64 @@ class OllamaSetup:
         except Exception as e:
             self.print_message(f"Unexpected error: {e}", "error")
 
+    def _render_pull_progress(self, response) -> Optional[str]:
+        """Render /api/pull progress events, returning the error message if the pull failed"""
+        out = sys.stdout
+        pending = io.StringIO()  # Written to the terminal in one go every 100ms
+        last_flush = 0.0
+        last_status = None
+        progress = ""  # Latest in-place progress line
+        progress_dirty = False
+        error = None
+
+        for raw_event in response.iter_lines():
+            if not raw_event:
+                continue
+            event = json.loads(raw_event)
+            if "error" in event:
+                error = event["error"]
+                break
+
+            status = event.get("status", "")
+            total = event.get("total")
+
+            # A new phase: finish any progress line and show the new status
+            if status != last_status:
+                if progress:
+                    pending.write(f"\r{progress}\033[K\n")
+                    progress = ""
+                    progress_dirty = False
+                if not total and status != "success":
+                    pending.write(f"{status}\n")
+                last_status = status
+
+            # Download phases report byte counts; redraw them in place
+            if total:
+                completed = event.get("completed", 0)
+                progress = (
+                    f"{status}: {completed * 100 // total}% "
+                    f"({completed / 1e9:.2f}/{total / 1e9:.2f} GB)"
+                )
+                progress_dirty = True
+
+            now = time.monotonic()
+            if now - last_flush >= 0.1:
+                if progress_dirty:
+                    pending.write(f"\r{progress}\033[K")
+                    progress_dirty = False
+                out.write(pending.getvalue())
+                out.flush()
+                pending.seek(0)
+                pending.truncate()
+                last_flush = now
+
+        # Flush buffered output and end the progress line before any error is reported
+        if progress:
+            pending.write(f"\r{progress}\033[K\n")
+        out.write(pending.getvalue())
+        out.flush()
+        return error
+
     def pull_model(self, model_name: str) -> None:
         """Pull a specific model from Ollama's model hub"""
         try:
@@ -477,53 +916,32 @@ class OllamaSetup:
         self.print_message(f"Pulling model: {model_name}...")
         
         # Ensure Ollama is running before pulling
-        if not self.is_ollama_running():
-            self.start_ollama()
-            # Wait for Ollama to initialize
-            time.sleep(3)
-        
-        # Pull the model
-        process = subprocess.Popen(
-            ["ollama", "pull", model_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True
-        )
-        
-        # Track progress without showing repeating "pulling manifest" messages
-        last_message = ""
-        manifest_count = 0
+        self._ensure_ollama_ready()
         
-        for line in process.stdout:
-            line = line.strip()
-            
-            # Handle repetitive "pulling manifest" messages
-            if line == "pulling manifest":
-                manifest_count += 1
-                if manifest_count == 1:
-                    print(f"Pulling manifest{'.' * min(manifest_count, 3)}", end="\r")
-                elif manifest_count % 5 == 0:  # Update progress dots every 5 iterations
-                    print(f"Pulling manifest{'.' * min(manifest_count//5, 10)}", end="\r")
-                continue
-            
-            # For non-manifest messages, print normally if they're not repeats
-            if line != last_message and line:
-                if manifest_count > 0:
-                    print()  # End the previous line if we were showing manifest progress
-                    manifest_count = 0
-                print(line)
-                last_message = line
-        
-        # Ensure we end with a newline
-        if manifest_count > 0:
-            print()
-        
-        # Wait for the process to complete
-        exit_code = process.wait()
-        if exit_code == 0:
+        # Pull through the API, which streams one JSON progress event per line
+        requests = _import_requests()
+        try:
+            with _get_session().post(
+                _ollama_api_url("/api/pull"),
+                json={"model": model_name, "name": model_name},  # "name" for older Ollama
+                stream=True,
+                timeout=(config.connect_timeout, None)  # Large layers can take a while
+            ) as response:
+                if response.ok:
+                    error = self._render_pull_progress(response)
+                else:
+                    try:
+                        error = response.json().get("error", f"HTTP {response.status_code}")
+                    except ValueError:
+                        error = f"HTTP {response.status_code}"
+        except (requests.exceptions.RequestException, ValueError) as e:
+            error = str(e)
+
+        if error is None:
+            self._models_cache = None  # The installed set just changed
             self.print_message(f"Successfully pulled model: {model_name}")
         else:
-            self.print_message(f"Failed to pull model: {model_name}", "error")
+            self.print_message(f"Failed to pull model: {model_name} ({error})", "error")
 
     def run_model(self, model_name: str) -> None:
         """Run a specific model in interactive mode"""
@@ -536,67 +954,87 @@ class OllamaSetup:
         self.print_message(f"Running model: {model_name}...")
         
         # Ensure Ollama is running
-        if not self.is_ollama_running():
-            self.start_ollama()
-            # Wait for Ollama to initialize
-            time.sleep(3)
+        self._ensure_ollama_ready()
         
-        # Run the model in interactive mode
+        # Hand the process over to the interactive session; nothing runs after it
+        sys.stdout.flush()
+        sys.stderr.flush()
         try:
-            subprocess.run(["ollama", "run", model_name], check=True)
-        except subprocess.CalledProcessError:
+            os.execvp("ollama", ["ollama", "run", model_name])
+        except OSError:
             self.print_message(f"Error running model: {model_name}", "error")
 
+    def _api_tags(self) -> dict:
+        """Fetch the installed-model listing from the Ollama API (GET /api/tags)"""
+        response = _get_session().get(_ollama_api_url("/api/tags"), timeout=config.api_timeout)
+        response.raise_for_status()
+        return response.json()
+
     def list_models(self) -> None:
         """List all available models on the local Ollama instance"""
         # Ensure Ollama is running
-        if not self.is_ollama_running():
-            self.start_ollama()
-            # Wait for Ollama to initialize
-            time.sleep(3)
+        self._ensure_ollama_ready()
         
+        requests = _import_requests()
         try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True
-            )
-            print("\nAvailable models on your Ollama instance:")
-            print(result.stdout)
-        except subprocess.CalledProcessError as e:
-            self.print_message(f"Error listing models: {e.stderr}", "error")
+            models = self._api_tags().get("models", [])
+        except requests.exceptions.ConnectionError:
+            # API unreachable; let the CLI try instead
+            try:
+                result = self._run(["ollama", "list"], capture=True, stderr=subprocess.DEVNULL)
+                print("\nAvailable models on your Ollama instance:")
+                print(result.stdout)
+            except subprocess.CalledProcessError as e:
+                self.print_message(f"Error listing models: {e.stderr}", "error")
+            return
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.print_message(f"Error listing models: {e}", "error")
+            return
+
+        if not models:
+            self.print_message("No models installed.")
+            return
+
+        print("\nAvailable models on your Ollama instance:")
+        print(f"{'NAME':<40} {'SIZE':>9}  MODIFIED")
+        for model in models:
+            size = f"{model.get('size', 0) / 1e9:.1f} GB"
+            modified = model.get("modified_at", "")[:19].replace("T", " ")
+            print(f"{model['name']:<40} {size:>9}  {modified}")
+        print()
     
     def get_installed_models(self) -> List[str]:
         """Return a list of installed model names"""
         # Ensure Ollama is running
-        if not self.is_ollama_running():
-            self.start_ollama()
-            # Wait for Ollama to initialize
-            time.sleep(3)
+        self._ensure_ollama_ready()
         
+        # Serve recent results from the cache
+        if self._models_cache is not None:
+            cached_at, models = self._models_cache
+            if time.monotonic() - cached_at < config.models_cache_ttl:
+                return list(models)
+
+        # Ask the running daemon directly; fall back to the CLI only if it's unreachable
+        requests = _import_requests()
         try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True
-            )
+            models = [model["name"] for model in self._api_tags().get("models", [])]
+        except requests.exceptions.ConnectionError:
+            try:
+                result = self._run(["ollama", "list"], capture=True)
+            except subprocess.CalledProcessError:
+                return []
             
             models = []
-            # Skip the header line and extract model names
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:  # There's at least one model
-                for line in lines[1:]:  # Skip header
-                    parts = line.split()
-                    if parts:  # Non-empty line with parts
-                        models.append(parts[0])
-            
-            return models
-        except subprocess.CalledProcessError:
+            # Skip the header line; the name is the first column of each row
+            for line in result.stdout.splitlines()[1:]:
+                name = line.split(None, 1)
+                if name:  # Skip blank lines
+                    models.append(name[0])
+        except (requests.exceptions.RequestException, ValueError, KeyError):
             return []
+
+        self._models_cache = (time.monotonic(), models)
+        return list(models)
             
     def ensure_default_model(self) -> None:
         """Check if any models are installed, pull the default if none"""
@@ -610,22 +1048,62 @@ class OllamaSetup:
 
     def prompt_for_confirmation(self, message: str) -> bool:
         """Prompt user for confirmation"""
-        response = input(f"{config.yellow}[?]{config.reset} {message} [Y/n]: ").strip().lower()
-        return response in ("", "y", "yes")
+        sys.stdout.write(f"{_PREFIXES['question']} {message} [Y/n]: ")
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            # EOF: nobody is there to confirm, so don't assume yes
+            sys.stdout.write("\n")
+            return False
+        return line.strip().lower() in ("", "y", "yes")
+
+    def _ensure_tool(
+        self,
+        label: str,
+        installed: bool,
+        installer: Callable[[], None],
+        report_installed: bool = False
+    ) -> bool:
+        """Offer to install a missing tool; return whether it is available afterwards"""
+        if installed:
+            if report_installed:
+                self.print_message(f"{label} already installed.")
+            return True
+
+        if self.args.yes or self.prompt_for_confirmation(f"{label} not found. Install it?"):
+            installer()
+            return True
+
+        self.print_message(f"Skipping {label} installation.", "warn")
+        return False
+
+    def _probe_prerequisites(self) -> Tuple[bool, bool, bool]:
+        """Return (ollama installed, cloudflared installed, Ollama running)
+
+        Run one after another: each probe is a cached PATH lookup or a localhost
+        connect, far cheaper than starting threads to overlap them.
+        """
+        return self.is_installed("ollama"), self.is_installed("cloudflared"), self.is_ollama_running()
 
     def run(self) -> None:
         """Main execution function"""
-        args = self.parser.parse_args()
+        # Parse once; argv doesn't change for the life of the process
+        self.args = args = self._create_argument_parser().parse_args()
         
         # Handle special commands first
+        if args.stop_tunnel:
+            self.stop_persistent_tunnel()
+            return
+
         if args.list_domains:
             self.list_cloudflare_domains()
             return
             
         if args.check:
-            self.print_message(f"Ollama installed: {self.is_installed('ollama')}")
-            self.print_message(f"cloudflared installed: {self.is_installed('cloudflared')}")
-            self.print_message(f"Ollama running: {self.is_ollama_running()}")
+            ollama_installed, cloudflared_installed, ollama_running = self._probe_prerequisites()
+            self.print_message(f"Ollama installed: {ollama_installed}")
+            self.print_message(f"cloudflared installed: {cloudflared_installed}")
+            self.print_message(f"Ollama running: {ollama_running}")
             return
             
         if args.list_models:
@@ -633,26 +1111,15 @@ class OllamaSetup:
             return
             
         # Handle model-specific commands
+        if args.pull or args.run:
+            if not self._ensure_tool("Ollama", self.is_installed("ollama"), self.install_ollama):
+                return
+
         if args.pull:
-            # Install Ollama if needed
-            if not self.is_installed("ollama"):
-                if args.yes or self.prompt_for_confirmation("Ollama not found. Install it?"):
-                    self.install_ollama()
-                else:
-                    self.print_message("Skipping Ollama installation.", "warn")
-                    return
             self.pull_model(args.pull)
             return
             
         if args.run:
-            # Install Ollama if needed
-            if not self.is_installed("ollama"):
-                if args.yes or self.prompt_for_confirmation("Ollama not found. Install it?"):
-                    self.install_ollama()
-                else:
-                    self.print_message("Skipping Ollama installation.", "warn")
-                    return
-            
             # Make sure we have at least one model before running
             models = self.get_installed_models()
             if not models:
@@ -669,37 +1136,29 @@ class OllamaSetup:
         auto_run = True
         
         if auto_run:
-            # Install Ollama if needed
-            if not self.is_installed("ollama"):
-                if args.yes or self.prompt_for_confirmation("Ollama not found. Install it?"):
-                    self.install_ollama()
-                else:
-                    self.print_message("Skipping Ollama installation.", "warn")
-                    return
-            else:
-                self.print_message("Ollama already installed.")
+            ollama_installed, cloudflared_installed, ollama_running = self._probe_prerequisites()
 
-            # Install cloudflared if needed
-            if not self.is_installed("cloudflared"):
-                if args.yes or self.prompt_for_confirmation("cloudflared not found. Install it?"):
-                    self.install_cloudflared()
-                else:
-                    self.print_message("Skipping cloudflared installation.", "warn")
-                    return
-            else:
-                self.print_message("cloudflared already installed.")
+            # Install Ollama and cloudflared if needed
+            if not self._ensure_tool("Ollama", ollama_installed, self.install_ollama, report_installed=True):
+                return
+            if not self._ensure_tool(
+                "cloudflared", cloudflared_installed, self.install_cloudflared, report_installed=True
+            ):
+                return
 
             # Start Ollama if not running
-            if not self.is_ollama_running():
-                self.start_ollama()
-            else:
+            if ollama_running:
                 self.print_message("Ollama already running.")
+            self._ensure_ollama_ready()
                 
             # Check if any models are installed
             self.ensure_default_model()
 
-            # Start tunnel
-            self.start_temp_tunnel()
+            # Start tunnel, reusing a persistent one if it's already up
+            if args.persist or self._persistent_tunnel_pid() is not None:
+                self.start_persistent_tunnel()
+            else:
+                self.start_temp_tunnel(verbose=args.verbose)
 
 
 if __name__ == "__main__":